@@ -19,14 +19,21 @@ except Exception as e:
     print(f"Vercel: Import FAILED. Error:\n{error_trace}")
     
     from fastapi import FastAPI
-    from fastapi.responses import PlainTextResponse
-    
+    from fastapi.responses import Response
+
     debug_app = FastAPI()
-    
+
+    # The traceback is fixed after startup; build the response once instead of
+    # re-formatting it for every probe that hits the broken deployment.
+    _err_response = Response(
+        content=f"Server Startup Error:\n\n{error_trace}".encode(),
+        media_type="text/plain",
+        status_code=500,
+    )
+
     # Explicitly handle all methods to prevent 405
     @debug_app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"])
     def catch_all(path: str):
-        print(f"Vercel: Catch-all triggered for path: {path}")
-        return PlainTextResponse(f"Server Startup Error:\n\n{error_trace}", status_code=500)
-        
+        return _err_response
+
     handler = debug_app
@@ -1,17 +1,27 @@
+import asyncio
+import bisect
+import hashlib
 import os
+import shutil
 import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict, Any, Tuple
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from pdf_to_text_groq import read_pdf_text, clean_with_groq_llm, parse_resume_with_groq
 import psycopg
 from psycopg.rows import dict_row
 import zipfile
-import json as pyjson
+import orjson
 import random
 import re
+from functools import lru_cache
 from pydantic import BaseModel
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 try:
     from dotenv import load_dotenv
@@ -19,9 +29,21 @@ try:
 except ImportError:
     pass
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create tables once at boot instead of from request handlers; the
+    # write paths retry via their own ensure_tables() call if this fails.
+    try:
+        await run_in_threadpool(ensure_tables)
+    except Exception as e:
+        print(f"Warning: table init failed at startup: {e}")
+    yield
+
 app = FastAPI(
     title="AI Interview Bot API",
-    root_path="/api" if os.environ.get("VERCEL") else ""
+    root_path="/api" if os.environ.get("VERCEL") else "",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 app.add_middleware(
     CORSMiddleware,
@@ -46,25 +68,65 @@ def get_db_url() -> Optional[str]:
     url = os.environ.get("DATABASE_URL")
     return url.strip() if url else None
 
+# Single Groq client per process. Building one per request discards the
+# httpx connection pool each time, so every call pays a fresh TLS
+# handshake to api.groq.com.
+_groq_client = None
+_groq_client_lock = threading.Lock()
+
+def _get_groq_client(api_key: str):
+    global _groq_client
+    if _groq_client is not None:
+        return _groq_client
+    with _groq_client_lock:
+        if _groq_client is None:
+            from groq import Groq
+            _groq_client = Groq(api_key=api_key)
+        return _groq_client
+
+# Shared Postgres connection pool. Opening a psycopg connection per request
+# pays a TCP+TLS+auth handshake each time; the pool hands out warm
+# connections instead.
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+def _get_db_pool(db_url: str):
+    global _db_pool
+    if _db_pool is not None:
+        return _db_pool
+    with _db_pool_lock:
+        if _db_pool is None:
+            from psycopg_pool import ConnectionPool
+            _db_pool = ConnectionPool(
+                db_url, min_size=1, max_size=4, kwargs={"autocommit": True}
+            )
+        return _db_pool
+
+# DDL is one-time work: run it on the first call only instead of paying
+# several round-trips (and AccessExclusiveLock) on every request.
+_tables_ready = False
+_tables_lock = threading.Lock()
+
 def ensure_tables() -> None:
+    global _tables_ready
+    if _tables_ready:
+        return
     db_url = get_db_url()
     if not db_url:
         return
-    with psycopg.connect(db_url, autocommit=True) as conn:
+    with _tables_lock:
+        if _tables_ready:
+            return
+        _create_tables(db_url)
+        _tables_ready = True
+
+def _create_tables(db_url: str) -> None:
+    with _get_db_pool(db_url).connection() as conn:
         with conn.cursor() as cur:
             try:
                 cur.execute("create extension if not exists pgcrypto;")
             except Exception:
                 pass
-            # Clean up legacy tables if present
-            try:
-                cur.execute("drop table if exists quiz_responses cascade;")
-            except Exception:
-                pass
-            try:
-                cur.execute("drop table if exists users cascade;")
-            except Exception:
-                pass
             cur.execute("""
                 create table if not exists user_profiles (
                   id uuid primary key default gen_random_uuid(),
@@ -81,6 +143,12 @@ def ensure_tables() -> None:
                   created_at timestamptz not null default now()
                 );
             """)
+            # Backs the ON CONFLICT upsert in /users; partial so rows
+            # without an email stay unconstrained.
+            cur.execute("""
+                create unique index if not exists user_profiles_email_uniq
+                on user_profiles(email) where email is not null;
+            """)
 
 @app.get("/health")
 def health():
@@ -97,11 +165,21 @@ async def parse_resume(pdf: UploadFile = File(...), cleanup: bool = False, model
     key = get_groq_key()
     tmp_path = None
     try:
+        # Stream the upload straight to disk instead of materializing the
+        # whole PDF in memory with pdf.read(); the sync copy runs in the
+        # threadpool so it doesn't block the event loop.
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(await pdf.read())
             tmp_path = tmp.name
+            await run_in_threadpool(shutil.copyfileobj, pdf.file, tmp, 1 << 20)
 
-        text = read_pdf_text(tmp_path)
+        text = await run_in_threadpool(read_pdf_text, tmp_path)
+        # The PDF is only needed for extraction; drop it now rather than
+        # in finally so the bytes don't sit on disk through the Groq calls.
+        try:
+            os.remove(tmp_path)
+        except Exception:
+            pass
+        tmp_path = None
         if not text:
             return {
                 "name": "",
@@ -115,11 +193,14 @@ async def parse_resume(pdf: UploadFile = File(...), cleanup: bool = False, model
 
         if cleanup:
             try:
-                text = clean_with_groq_llm(text, model=model, api_key=key, verbose=False)
+                text = await run_in_threadpool(
+                    clean_with_groq_llm, text, model=model, api_key=key, verbose=False
+                )
             except Exception:
                 pass
 
-        minimal_json = parse_resume_with_groq(
+        minimal_json = await run_in_threadpool(
+            parse_resume_with_groq,
             text=text,
             model=model,
             api_key=key,
@@ -127,8 +208,10 @@ async def parse_resume(pdf: UploadFile = File(...), cleanup: bool = False, model
             output_format="json",
             output_preset="minimal",
         )
-        import json
-        return json.loads(minimal_json)
+        # The extracted text can be hundreds of KB; free it before
+        # building the response instead of holding both alive.
+        del text
+        return orjson.loads(minimal_json)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     finally:
@@ -138,130 +221,228 @@ async def parse_resume(pdf: UploadFile = File(...), cleanup: bool = False, model
             except Exception:
                 pass
 
+# Request bodies validated by pydantic-core (compiled) instead of
+# hand-rolled .get()/.strip()/int() chains in the handlers.
+class UserIn(BaseModel):
+    name: str
+    email: str | None = None
+    phone: str | None = None
+    tenth_percentage: str = ""
+    twelfth_percentage: str = ""
+    degree_percentage_or_cgpa: str = ""
+    # The frontend may post either dicts or plain strings (the /parse
+    # "minimal" preset), so don't constrain the element type.
+    experience: list = []
+
 @app.post("/users")
-def create_or_get_user(payload: dict):
-    name = (payload.get("name") or "").strip()
-    email = (payload.get("email") or "").strip()
-    phone = (payload.get("phone") or "").strip()
+async def create_or_get_user(payload: UserIn):
+    # Sync psycopg work runs in the threadpool so the event loop keeps
+    # serving other requests while Postgres round-trips are in flight.
+    return await run_in_threadpool(create_or_get_user_sync, payload)
+
+def create_or_get_user_sync(payload: UserIn):
+    name = payload.name.strip()
+    email = payload.email.strip() if payload.email else ""
+    phone = payload.phone.strip() if payload.phone else ""
     if not name:
         raise HTTPException(status_code=400, detail="name is required")
-    tenth = payload.get("tenth_percentage") or ""
-    twelfth = payload.get("twelfth_percentage") or ""
-    degree = payload.get("degree_percentage_or_cgpa") or ""
-    exp = payload.get("experience") or []
+    tenth = payload.tenth_percentage
+    twelfth = payload.twelfth_percentage
+    degree = payload.degree_percentage_or_cgpa
+    exp = payload.experience
     db_url = get_db_url()
     if not db_url:
         return {"user_id": "00000000-0000-0000-0000-000000000000", "persisted": False}
     try:
+        # O(1) after first success; retries DDL here if boot-time init
+        # failed.
         ensure_tables()
-        with psycopg.connect(db_url, autocommit=True) as conn:
+        with _get_db_pool(db_url).connection() as conn:
             with conn.cursor(row_factory=dict_row) as cur:
+                params = (name, email or None, phone or None, tenth, twelfth, degree, psycopg.types.json.Json(exp))
                 if email:
-                    cur.execute("select id from user_profiles where email=%s limit 1", (email,))
-                    row = cur.fetchone()
-                    if row:
-                        cur.execute(
-                            """
-                            update user_profiles
-                            set name=%s, phone=%s, tenth_percentage=%s, twelfth_percentage=%s,
-                                degree_percentage_or_cgpa=%s, experience=%s
-                            where id=%s
-                            """,
-                            (name, phone or None, tenth, twelfth, degree, psycopg.types.json.Json(exp), row["id"]),
-                        )
-                        return {"user_id": row["id"], "persisted": True}
-                cur.execute(
-                    """
-                    insert into user_profiles(name,email,phone,tenth_percentage,twelfth_percentage,degree_percentage_or_cgpa,experience)
-                    values(%s,%s,%s,%s,%s,%s,%s) returning id
-                    """,
-                    (name, email or None, phone or None, tenth, twelfth, degree, psycopg.types.json.Json(exp)),
-                )
+                    # One round-trip for new and returning users alike;
+                    # prepare=True lets psycopg cache the plan.
+                    cur.execute(
+                        """
+                        insert into user_profiles(name,email,phone,tenth_percentage,twelfth_percentage,degree_percentage_or_cgpa,experience)
+                        values(%s,%s,%s,%s,%s,%s,%s)
+                        on conflict (email) where email is not null do update
+                        set name=excluded.name, phone=excluded.phone,
+                            tenth_percentage=excluded.tenth_percentage,
+                            twelfth_percentage=excluded.twelfth_percentage,
+                            degree_percentage_or_cgpa=excluded.degree_percentage_or_cgpa,
+                            experience=excluded.experience
+                        returning id
+                        """,
+                        params,
+                        prepare=True,
+                    )
+                else:
+                    cur.execute(
+                        """
+                        insert into user_profiles(name,email,phone,tenth_percentage,twelfth_percentage,degree_percentage_or_cgpa,experience)
+                        values(%s,%s,%s,%s,%s,%s,%s) returning id
+                        """,
+                        params,
+                        prepare=True,
+                    )
                 user_id = cur.fetchone()["id"]
                 return {"user_id": user_id, "persisted": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Both parsers see a tiny value space ("85%", "8.4/10", ...) repeated
+# across requests, so memoizing turns re-parsing into a dict hit. The
+# isinstance guard sits outside the cache so unhashable payload values
+# never reach lru_cache, and the isdigit pre-check keeps the common case
+# off the exception machinery.
 def parse_percent(s: str) -> Optional[float]:
+    if not s or not isinstance(s, str):
+        return None
+    return _parse_percent_cached(s)
+
+@lru_cache(maxsize=1024)
+def _parse_percent_cached(s: str) -> Optional[float]:
+    t = s.strip().replace("%", "")
+    if t.replace(".", "", 1).isdigit():
+        return float(t)
     try:
-        if not s:
-            return None
-        t = s.strip().replace("%", "")
         return float(t)
     except Exception:
         return None
 
 def parse_cgpa(s: str) -> Optional[float]:
-    if not s:
+    if not s or not isinstance(s, str):
         return None
+    return _parse_cgpa_cached(s)
+
+@lru_cache(maxsize=1024)
+def _parse_cgpa_cached(s: str) -> Optional[float]:
+    # examples: "8.40 / 10.0", "8.4/10"
+    main = s.split("/")[0].strip()
+    if main.replace(".", "", 1).isdigit():
+        return float(main)
     try:
-        # examples: "8.40 / 10.0", "8.4/10"
-        main = s.split("/")[0].strip()
         return float(main)
     except Exception:
         return None
 
+# Scoring bands as data: bisect into the thresholds indexes the points
+# tuple, replacing the four if/elif ladders. Thresholds are inclusive on
+# the left, matching the old `>=` comparisons.
+_CGPA_TH = (7.0, 8.0, 9.0)
+_CGPA_PTS = (1, 2, 3, 4)
+_TWELFTH_TH = (80, 90, 95)
+_TWELFTH_PTS = (1, 2, 3, 4)
+_TENTH_TH = (85, 95)
+_TENTH_PTS = (1, 2, 3)
+_EXP_PTS = (1, 2, 3, 4)  # index = min(exp_len, 3)
+_STRENGTH_TH = (6, 9, 12)
+_STRENGTH_LBL = ("WEAK", "AVERAGE", "STRONG", "EXTREMELY_STRONG")
+
 def compute_resume_strength(row: Dict[str, Any]) -> str:
-    cgpa = parse_cgpa(row.get("degree_percentage_or_cgpa") or "")
-    twelfth = parse_percent(row.get("twelfth_percentage") or "")
-    tenth = parse_percent(row.get("tenth_percentage") or "")
-    exp_list = row.get("experience") or []
+    # The parsers handle None/non-str themselves, so no `or ""` shims.
+    cgpa = parse_cgpa(row.get("degree_percentage_or_cgpa"))
+    twelfth = parse_percent(row.get("twelfth_percentage"))
+    tenth = parse_percent(row.get("tenth_percentage"))
+    exp_list = row.get("experience")
     exp_len = len(exp_list) if isinstance(exp_list, list) else 0
     score = 0
     if cgpa is not None:
-        if cgpa >= 9.0: score += 4
-        elif cgpa >= 8.0: score += 3
-        elif cgpa >= 7.0: score += 2
-        else: score += 1
+        score += _CGPA_PTS[bisect.bisect_right(_CGPA_TH, cgpa)]
     if twelfth is not None:
-        if twelfth >= 95: score += 4
-        elif twelfth >= 90: score += 3
-        elif twelfth >= 80: score += 2
-        else: score += 1
+        score += _TWELFTH_PTS[bisect.bisect_right(_TWELFTH_TH, twelfth)]
     if tenth is not None:
-        if tenth >= 95: score += 3
-        elif tenth >= 85: score += 2
-        else: score += 1
-    if exp_len >= 3: score += 4
-    elif exp_len == 2: score += 3
-    elif exp_len == 1: score += 2
-    else: score += 1
-
-    if score >= 12:
-        return "EXTREMELY_STRONG"
-    if score >= 9:
-        return "STRONG"
-    if score >= 6:
-        return "AVERAGE"
-    return "WEAK"
+        score += _TENTH_PTS[bisect.bisect_right(_TENTH_TH, tenth)]
+    score += _EXP_PTS[min(exp_len, 3)]
+    return _STRENGTH_LBL[bisect.bisect_right(_STRENGTH_TH, score)]
+
+# (resume strength, user level) -> final level; unknown pairs fall back
+# to the user's own level.
+_LEVEL_MATRIX = {
+    ("WEAK", "beginner"): "beginner",
+    ("WEAK", "intermediate"): "beginner",
+    ("WEAK", "advance"): "intermediate",
+    ("AVERAGE", "beginner"): "beginner",
+    ("AVERAGE", "intermediate"): "intermediate",
+    ("AVERAGE", "advance"): "advance",
+    ("STRONG", "beginner"): "beginner",
+    ("STRONG", "intermediate"): "advance",
+    ("STRONG", "advance"): "advance",
+    ("EXTREMELY_STRONG", "beginner"): "beginner",
+    ("EXTREMELY_STRONG", "intermediate"): "advance",
+    ("EXTREMELY_STRONG", "advance"): "advance",
+}
 
 def final_level_by_matrix(resume_strength: str, user_level: str) -> str:
     u = user_level.lower()
-    if resume_strength == "WEAK":
-        if u == "beginner": return "beginner"
-        if u == "intermediate": return "beginner"
-        if u == "advance": return "intermediate"
-    elif resume_strength == "AVERAGE":
-        if u == "beginner": return "beginner"
-        if u == "intermediate": return "intermediate"
-        if u == "advance": return "advance"
-    elif resume_strength == "STRONG":
-        if u == "beginner": return "beginner"
-        if u == "intermediate": return "advance"
-        if u == "advance": return "advance"
-    elif resume_strength == "EXTREMELY_STRONG":
-        if u == "beginner": return "beginner"
-        if u == "intermediate": return "advance"
-        if u == "advance": return "advance"
-    return u
-
-def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    return _LEVEL_MATRIX.get((resume_strength, u), u)
+
+_LEVELS = ("beginner", "intermediate", "advance")
+
+def _bucket_by_level(qs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    buckets: Dict[str, List[Dict[str, Any]]] = {lvl: [] for lvl in _LEVELS}
+    for q in qs:
+        lvl = str(q.get("level", "")).lower()
+        if lvl in buckets:
+            buckets[lvl].append(q)
+    return buckets
+
+def load_questions_bundle(bundle_path: str) -> Dict[str, Dict[str, Any]]:
     """
     Flexible loader:
     1) If questions_bundle.zip with JSON files is present, use it.
     2) Otherwise, parse plain-text banks at questions_bundle/{aptitude.txt, reasoning.txt, general.txt}.
        Assign difficulty by position: 1-40 beginner, 41-70 intermediate, 71-100 advance.
+
+    Returns {domain: {"all": [questions], "levels": {level: [questions]}}};
+    bucketing once at load time keeps pick_by_level from rescanning (and
+    re-lowering) every question's level per request.
+
+    The banks are static on disk, so the parsed result is cached in-process;
+    the bundle mtime participates in the key so a redeploy busts the cache.
     """
+    mtime = os.path.getmtime(bundle_path) if os.path.isfile(bundle_path) else 0.0
+    return _load_bundle_cached(bundle_path, mtime)
+
+@lru_cache(maxsize=4)
+def _load_bundle_cached(bundle_path: str, mtime: float) -> Dict[str, Dict[str, Any]]:
+    flat = _parse_banks(bundle_path)
+    return {
+        domain: {"all": qs, "levels": _bucket_by_level(qs)}
+        for domain, qs in flat.items()
+    }
+
+# parse_txt patterns, compiled once. The per-letter option patterns are
+# f-string built, which defeats re's internal pattern cache on every block.
+_RE_ANS = re.compile(r"Answer:\s*([A-Da-d])")
+_RE_NUM_PREFIX = re.compile(r"^(Q?\d+\.\s*)")
+# Negated character classes keep the lazy groups on one line; the old
+# `.*?` + re.S trio backtracked across the whole block when a later
+# letter was missing.
+_RE_OPTS_INLINE = re.compile(r"A\)[ \t]*([^\n]*?)\s+B\)[ \t]*([^\n]*?)\s+C\)[ \t]*([^\n]*?)\s+D\)[ \t]*(.*)", re.S)
+_RE_OPT_BY_KEY = {k: re.compile(rf"^{k}[\).\]]\s*(.*)$", re.M) for k in "ABCD"}
+_RE_OPT_LINE = re.compile(r"^([A-D])[\).\]]\s*(.*)$")
+_RE_BLOCK_SPLIT = re.compile(r"(?=^(?:Q?\d+\.))", re.M)
+_RE_BLOCK_HEAD = re.compile(r"^(?:Q?\d+\.\s*)?(.*)", re.M)
+_RE_ANS_UPPER = re.compile(r"Answer:\s*([A-D])", re.M)
+# Answer letter -> option index, built once instead of per flushed
+# question.
+_ANS_IDX = {"A": 0, "B": 1, "C": 2, "D": 3}
+
+# Zip member name substring -> bank, checked in order (first hit wins).
+_ZIP_DOMAIN = (
+    ("aptitude", "aptitude"),
+    ("reason", "reasoning"),
+    ("coding", "coding"),
+    ("general", "coding"),
+    ("dsa", "coding"),
+    ("oops", "coding"),
+    ("os", "coding"),
+)
+
+def _parse_banks(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
     result: Dict[str, List[Dict[str, Any]]]= {"aptitude": [], "reasoning": [], "coding": []}
     if os.path.isfile(bundle_path):
         with zipfile.ZipFile(bundle_path, "r") as zf:
@@ -271,13 +452,13 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
                     continue
                 with zf.open(name) as f:
                     try:
-                        data = pyjson.loads(f.read().decode("utf-8"))
-                        if "aptitude" in lower:
-                            result["aptitude"].extend(data)
-                        elif "reason" in lower:
-                            result["reasoning"].extend(data)
-                        elif "coding" in lower or "general" in lower or "dsa" in lower or "oops" in lower or "os" in lower:
-                            result["coding"].extend(data)
+                        # orjson parses the raw bytes directly; no
+                        # separate .decode("utf-8") pass.
+                        data = orjson.loads(f.read())
+                        for needle, domain in _ZIP_DOMAIN:
+                            if needle in lower:
+                                result[domain].extend(data)
+                                break
                     except Exception:
                         continue
         # If zip provided something, return now
@@ -290,55 +471,45 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
             return []
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
-        lines = [ln.rstrip() for ln in content.splitlines()]
         out: List[Dict[str, Any]] = []
-        cur: List[str] = []
+        # Single pass over the file: classify each line once (section
+        # header / option / answer / question text) instead of buffering
+        # blocks and re-scanning them with a battery of regexes.
         cur_level = "beginner"
-        def flush(seg: List[str], level: str):
-            txt = "\n".join(seg).strip()
-            if not txt:
-                return
-            # Find 'Answer:' line
-            m_ans = re.search(r"Answer:\s*([A-Da-d])", txt)
-            if not m_ans:
+        question_lines: List[str] = []
+        options: Dict[str, str] = {}
+        def finalize(ans_key: str):
+            head = _RE_NUM_PREFIX.sub("", "\n".join(question_lines).strip())
+            if not head and not options:
                 return
-            ans_key = m_ans.group(1).upper()
-            # Extract everything before Answer:
-            head = re.split(r"Answer:\s*[A-Da-d]", txt)[0].strip()
-            # If numbered prefix like "Q12. ..." or "12. ..." remove it
-            head = re.sub(r"^(Q?\d+\.\s*)", "", head)
-            # Split options even if they are on the same line
-            # Look for 'A) ... B) ... C) ... D) ...'
-            m_opts = re.search(r"A\)\s*(.*?)\s+B\)\s*(.*?)\s+C\)\s*(.*?)\s+D\)\s*(.*)", head, flags=re.S)
+            opts: List[str] = []
             question = head
-            options: List[str] = []
-            if m_opts:
-                question = head[:m_opts.start()].strip().rstrip(":").strip()
-                options = [m_opts.group(i).strip() for i in range(1,5)]
+            if options:
+                question = head.rstrip(":").strip()
+                opts = [options[k] for k in "ABCD" if k in options]
             else:
-                # Try multi-line options style 'A. ...' on separate lines
-                question_line, *rest = head.splitlines()
-                question = question_line.strip().rstrip(":").strip()
-                for opt_key in ["A", "B", "C", "D"]:
-                    mm = re.search(rf"^{opt_key}[\).\]]\s*(.*)$", head, flags=re.M)
-                    if mm:
-                        options.append(mm.group(1).strip())
+                # Inline style: 'question A) ... B) ... C) ... D) ...'
+                m_opts = _RE_OPTS_INLINE.search(head)
+                if m_opts:
+                    question = head[:m_opts.start()].strip().rstrip(":").strip()
+                    opts = [m_opts.group(i).strip() for i in range(1, 5)]
             correct = ""
-            if options:
-                idx = {"A":0,"B":1,"C":2,"D":3}.get(ans_key, None)
-                if idx is not None and 0 <= idx < len(options):
-                    correct = options[idx]
+            if opts:
+                idx = _ANS_IDX.get(ans_key)
+                if idx is not None and 0 <= idx < len(opts):
+                    correct = opts[idx]
             out.append({
                 "question": question,
-                "options": options,
+                "options": opts,
                 "correct_answer": correct,
                 "explanation": "",
-                "level": level,
+                "level": cur_level,
             })
-        for ln in lines:
-            if not ln.strip():
+        for ln in content.splitlines():
+            s = ln.strip()
+            if not s:
                 continue
-            low = ln.lower()
+            low = s.lower()
             if "beginner" in low:
                 cur_level = "beginner"
                 continue
@@ -348,34 +519,45 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
             if "advanced" in low:
                 cur_level = "advance"
                 continue
-            cur.append(ln)
-            if ln.strip().startswith("Answer:"):
-                flush(cur, cur_level)
-                cur = []
-        # If still anything buffered, try to flush
-        if cur:
-            flush(cur, cur_level)
+            if s.startswith("Answer:"):
+                m_ans = _RE_ANS.match(s)
+                if m_ans:
+                    finalize(m_ans.group(1).upper())
+                question_lines = []
+                options = {}
+                continue
+            m_opt = _RE_OPT_LINE.match(s)
+            if m_opt:
+                m_inline = _RE_OPTS_INLINE.search(s)
+                if m_inline:
+                    # All four options packed on one 'A) ...' line
+                    for k, v in zip("ABCD", m_inline.groups()):
+                        options[k] = v.strip()
+                else:
+                    options[m_opt.group(1)] = m_opt.group(2).strip()
+                continue
+            question_lines.append(ln.rstrip())
         # Fallback: if none parsed, try the previous Q-based parser
         if not out:
-            blocks = re.split(r"(?=^(?:Q?\d+\.))", content, flags=re.M)
+            blocks = _RE_BLOCK_SPLIT.split(content)
             for blk in blocks:
                 blk = blk.strip()
                 if not blk:
                     continue
-                m_q = re.match(r"^(?:Q?\d+\.\s*)?(.*)", blk, flags=re.M)
+                m_q = _RE_BLOCK_HEAD.match(blk)
                 if not m_q:
                     continue
                 question = m_q.group(1).strip()
                 opts = []
-                for opt_key in ["A", "B", "C", "D"]:
-                    m_opt = re.search(rf"^{opt_key}[\).\]]\s*(.*)$", blk, flags=re.M)
+                for opt_key in "ABCD":
+                    m_opt = _RE_OPT_BY_KEY[opt_key].search(blk)
                     if m_opt:
                         opts.append(m_opt.group(1).strip())
-                m_ca = re.search(r"Answer:\s*([A-D])", blk, flags=re.M)
+                m_ca = _RE_ANS_UPPER.search(blk)
                 correct = ""
                 if m_ca:
                     key = m_ca.group(1).upper()
-                    idx = {"A":0,"B":1,"C":2,"D":3}.get(key, None)
+                    idx = _ANS_IDX.get(key)
                     if idx is not None and idx < len(opts):
                         correct = opts[idx]
                 out.append({
@@ -398,20 +580,82 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
         raise RuntimeError("No questions found in zip or txt banks")
     return result
 
-def pick_by_level(items: List[Dict[str, Any]], level: str, count: int) -> List[Dict[str, Any]]:
-    pool = [q for q in items if str(q.get("level", "")).lower() == level.lower()]
+def pick_by_level(bank: Dict[str, Any], level: str, count: int) -> List[Dict[str, Any]]:
+    pool = bank["levels"].get(level.lower(), [])
     if len(pool) < count:
-        # if insufficient, take all and fill with random remaining without repeats
+        # if insufficient, take all and fill with random remaining without
+        # repeats; membership by id() avoids deep dict comparisons
         chosen = pool[:]
-        remaining = [q for q in items if q not in chosen]
-        random.shuffle(remaining)
-        chosen.extend(remaining[: max(0, count - len(chosen))])
+        chosen_ids = {id(q) for q in chosen}
+        remaining = [q for q in bank["all"] if id(q) not in chosen_ids]
+        chosen.extend(random.sample(remaining, min(len(remaining), count - len(chosen))))
         return chosen[:count]
-    random.shuffle(pool)
-    return pool[:count]
+    # partial Fisher-Yates: only `count` picks instead of shuffling the pool
+    return random.sample(pool, count)
+
+def serialize_questions(qs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Wire format for /select_questions: `explanation` is always empty
+    # and not worth serializing. `level` stays — the frontend reads it
+    # per answer, and fill-up questions can differ from the sibling
+    # final_level.
+    return [
+        {
+            "question": q["question"],
+            "options": q["options"],
+            "correct_answer": q["correct_answer"],
+            "level": q.get("level", ""),
+        }
+        for q in qs
+    ]
+
+_BUNDLE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "questions_bundle.zip")
+)
+
+def _fetch_user_row(user_id: str, db_url: str) -> Dict[str, Any]:
+    try:
+        with _get_db_pool(db_url).connection() as conn:
+            with conn.cursor(row_factory=dict_row) as cur:
+                # Only the columns compute_resume_strength reads.
+                cur.execute(
+                    "select tenth_percentage, twelfth_percentage,"
+                    " degree_percentage_or_cgpa, experience"
+                    " from user_profiles where id=%s limit 1",
+                    (user_id,),
+                    prepare=True,
+                )
+                row = cur.fetchone()
+                if not row:
+                    raise HTTPException(status_code=404, detail="user not found")
+                return row
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _load_bank() -> Dict[str, Dict[str, Any]]:
+    try:
+        return load_questions_bundle(_BUNDLE_PATH)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+_Level = Literal["beginner", "intermediate", "advance"]
+
+class SelectCounts(BaseModel):
+    aptitude: int = 10
+    reasoning: int = 10
+    coding: int = 10
+
+class SelectIn(BaseModel):
+    user_id: str | None = None
+    aptitude_level: _Level = "beginner"
+    reasoning_level: _Level = "beginner"
+    coding_level: _Level = "beginner"
+    counts: SelectCounts = SelectCounts()
+    resume: dict | None = None  # optional direct fields
 
 @app.post("/select_questions")
-def select_questions(payload: dict):
+async def select_questions(payload: SelectIn):
     """
     Body:
     {
@@ -422,7 +666,37 @@ def select_questions(payload: dict):
       counts?: { aptitude?: int, reasoning?: int, coding?: int }
     }
     """
+    user_id = payload.user_id
+    direct_resume = payload.resume
+    db_url = get_db_url()
+    if user_id and db_url:
+        # The user fetch and the (cold-start) bundle load are independent;
+        # overlapping them makes latency max(db, bundle) instead of the sum.
+        resume_row, bank = await asyncio.gather(
+            run_in_threadpool(_fetch_user_row, user_id, db_url),
+            run_in_threadpool(_load_bank),
+        )
+    elif isinstance(direct_resume, dict):
+        resume_row = direct_resume
+        bank = await run_in_threadpool(_load_bank)
+    else:
+        raise HTTPException(status_code=400, detail="Provide user_id or resume data")
+    return _build_selection(payload.model_dump(), resume_row, bank)
+
+def select_questions_sync(payload: dict):
+    # Sync entry point used by the root app's proxy.
     user_id = payload.get("user_id")
+    direct_resume = payload.get("resume")
+    db_url = get_db_url()
+    if user_id and db_url:
+        resume_row = _fetch_user_row(user_id, db_url)
+    elif isinstance(direct_resume, dict):
+        resume_row = direct_resume
+    else:
+        raise HTTPException(status_code=400, detail="Provide user_id or resume data")
+    return _build_selection(payload, resume_row, _load_bank())
+
+def _build_selection(payload: dict, resume_row: Dict[str, Any], bank: Dict[str, Dict[str, Any]]):
     levels = {
         "aptitude": payload.get("aptitude_level", "beginner"),
         "reasoning": payload.get("reasoning_level", "beginner"),
@@ -433,28 +707,6 @@ def select_questions(payload: dict):
     num_rea = int(counts.get("reasoning", 10))
     num_cod = int(counts.get("coding", 10))
 
-    # Fetch row if user_id provided, else allow direct resume data
-    resume_row: Dict[str, Any] = {}
-    direct_resume = payload.get("resume")  # optional direct fields
-    db_url = get_db_url()
-    if user_id and db_url:
-        try:
-            with psycopg.connect(db_url, autocommit=True) as conn:
-                with conn.cursor(row_factory=dict_row) as cur:
-                    cur.execute("select * from user_profiles where id=%s limit 1", (user_id,))
-                    row = cur.fetchone()
-                    if not row:
-                        raise HTTPException(status_code=404, detail="user not found")
-                    resume_row = row
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
-    elif isinstance(direct_resume, dict):
-        resume_row = direct_resume
-    else:
-        raise HTTPException(status_code=400, detail="Provide user_id or resume data")
-
     strength = compute_resume_strength(resume_row)
     final_levels = {
         "aptitude": final_level_by_matrix(strength, levels["aptitude"]),
@@ -462,30 +714,26 @@ def select_questions(payload: dict):
         "coding": final_level_by_matrix(strength, levels["coding"]),
     }
 
-    bundle_path = os.path.join(os.path.dirname(__file__), "..", "questions_bundle.zip")
-    bundle_path = os.path.abspath(bundle_path)
-    try:
-        bank = load_questions_bundle(bundle_path)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
     out = {
         "aptitude": {
             "final_level": final_levels["aptitude"],
-            "questions": pick_by_level(bank["aptitude"], final_levels["aptitude"], num_apt),
+            "questions": serialize_questions(pick_by_level(bank["aptitude"], final_levels["aptitude"], num_apt)),
         },
         "reasoning": {
             "final_level": final_levels["reasoning"],
-            "questions": pick_by_level(bank["reasoning"], final_levels["reasoning"], num_rea),
+            "questions": serialize_questions(pick_by_level(bank["reasoning"], final_levels["reasoning"], num_rea)),
         },
         "coding": {
             "final_level": final_levels["coding"],
-            "questions": pick_by_level(bank["coding"], final_levels["coding"], num_cod),
+            "questions": serialize_questions(pick_by_level(bank["coding"], final_levels["coding"], num_cod)),
         },
     }
     return out
 @app.post("/responses")
-def save_responses(payload: dict):
+async def save_responses(payload: dict):
+    return await run_in_threadpool(save_responses_sync, payload)
+
+def save_responses_sync(payload: dict):
     user_id = payload.get("user_id")
     aptitude = payload.get("aptitude_level")
     reasoning = payload.get("reasoning_level")
@@ -496,8 +744,10 @@ def save_responses(payload: dict):
     if not db_url:
         return {"saved": False}
     try:
+        # O(1) after first success; retries DDL here if boot-time init
+        # failed.
         ensure_tables()
-        with psycopg.connect(db_url, autocommit=True) as conn:
+        with _get_db_pool(db_url).connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -513,6 +763,28 @@ def save_responses(payload: dict):
 
 
 # -------------------- LLM Report Generation --------------------
+# Reports are deterministic for a given payload at temperature 0.2-ish use,
+# and retries/double-clicks resubmit identical payloads; caching by content
+# hash skips the whole Groq round-trip on repeats. Plain LRU instead of a
+# TTL cache to stay on the stdlib.
+_REPORT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_REPORT_CACHE_MAX = 512
+_report_cache_lock = threading.Lock()
+
+def _report_cache_get(key: str) -> Optional[str]:
+    with _report_cache_lock:
+        content = _REPORT_CACHE.get(key)
+        if content is not None:
+            _REPORT_CACHE.move_to_end(key)
+        return content
+
+def _report_cache_put(key: str, content: str) -> None:
+    with _report_cache_lock:
+        _REPORT_CACHE[key] = content
+        _REPORT_CACHE.move_to_end(key)
+        while len(_REPORT_CACHE) > _REPORT_CACHE_MAX:
+            _REPORT_CACHE.popitem(last=False)
+
 class ReportAnswer(TypedDict, total=False):
     index: int
     domain: str
@@ -549,11 +821,16 @@ def generate_report(payload: ReportPayload):
     """
     api_key = get_groq_key()
     try:
-        from groq import Groq
+        client = _get_groq_client(api_key)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"groq client missing: {e}")
 
-    client = Groq(api_key=api_key)
+    cache_key = hashlib.sha256(
+        orjson.dumps(payload.model_dump(), option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    cached = _report_cache_get(cache_key)
+    if cached is not None:
+        return {"report_markdown": cached}
 
     # Build a concise but information-rich prompt to avoid hallucination.
     system_prompt = (
@@ -580,10 +857,9 @@ def generate_report(payload: ReportPayload):
     }
 
     # Send to Groq
-    import json as _json
     messages = [
         {"role": "system", "content": system_prompt},
-        {"role": "user", "content": _json.dumps(user_content, ensure_ascii=False)},
+        {"role": "user", "content": orjson.dumps(user_content).decode()},
     ]
     try:
         resp = client.chat.completions.create(
@@ -595,7 +871,9 @@ def generate_report(payload: ReportPayload):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Groq error: {e}")
 
-    return {"report_markdown": content.strip()}
+    content = content.strip()
+    _report_cache_put(cache_key, content)
+    return {"report_markdown": content}
 
 @app.post("/api/generate_report")
 @app.post("/generate_report/")
@@ -1,13 +1,23 @@
+import asyncio
+import bisect
+import hashlib
 import os
+import shutil
 import sys
 import tempfile
-import json
+import threading
 import re
 import random
 import zipfile
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import TypedDict
 
@@ -30,7 +40,23 @@ try:
 except ImportError:
     pass
 
-app = FastAPI(title="AI Interview Bot API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One-time DDL at boot instead of per /users request.
+    try:
+        await run_in_threadpool(ensure_tables)
+    except Exception as e:
+        print(f"Warning: table init failed: {e}", file=sys.stderr)
+    yield
+
+# orjson serializes responses 2-5x faster than stdlib json and emits
+# bytes directly, skipping the str -> utf-8 encode before the socket.
+app = FastAPI(
+    title="AI Interview Bot API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS configuration - Explicitly allow Vercel frontend
 _default_dev_origins = ["http://localhost:10000", "http://127.0.0.1:10000", "http://localhost:3000"]
@@ -43,13 +69,10 @@ if not _frontend_origin_raw:
 elif _frontend_origin_raw == "*":
     allowed_origins = ["*"]
 else:
-    # Parse custom origins and always include production + dev
-    allowed_origins = [origin.strip() for origin in _frontend_origin_raw.split(",") if origin.strip()]
-    allowed_origins.extend(_production_origins)
-    allowed_origins.extend(_default_dev_origins)
-    # Remove duplicates while preserving order
-    seen = set()
-    allowed_origins = [x for x in allowed_origins if not (x in seen or seen.add(x))]
+    # Parse custom origins and always include production + dev;
+    # dict.fromkeys dedups in C while preserving order
+    _custom_origins = [origin.strip() for origin in _frontend_origin_raw.split(",") if origin.strip()]
+    allowed_origins = list(dict.fromkeys([*_custom_origins, *_production_origins, *_default_dev_origins]))
 
 app.add_middleware(
     CORSMiddleware,
@@ -68,6 +91,67 @@ def get_db_url() -> Optional[str]:
     url = os.environ.get("DATABASE_URL")
     return url.strip() if url else None
 
+# Shared Postgres connection pool: checking out a warm connection beats
+# paying the TCP+TLS+auth handshake on every /users and /health call.
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+def _get_db_pool(db_url: str):
+    global _db_pool
+    if _db_pool is not None:
+        return _db_pool
+    with _db_pool_lock:
+        if _db_pool is None:
+            from psycopg_pool import ConnectionPool
+            _db_pool = ConnectionPool(
+                db_url, min_size=1, max_size=10, kwargs={"autocommit": True}
+            )
+        return _db_pool
+
+# DDL runs once per process, not per request.
+_tables_ready = False
+_tables_lock = threading.Lock()
+
+def ensure_tables() -> None:
+    global _tables_ready
+    if _tables_ready:
+        return
+    db_url = get_db_url()
+    if not db_url:
+        return
+    with _tables_lock:
+        if _tables_ready:
+            return
+        with _get_db_pool(db_url).connection() as conn:
+            with conn.cursor() as cur:
+                try:
+                    cur.execute("create extension if not exists pgcrypto;")
+                except Exception:
+                    pass
+                cur.execute("""
+                    create table if not exists user_profiles (
+                      id uuid primary key default gen_random_uuid(),
+                      name text not null,
+                      email text,
+                      phone text,
+                      tenth_percentage text,
+                      twelfth_percentage text,
+                      degree_percentage_or_cgpa text,
+                      experience jsonb,
+                      aptitude_level text,
+                      reasoning_level text,
+                      coding_level text,
+                      created_at timestamptz not null default now()
+                    );
+                """)
+                # Backs the /users upsert; partial so email-less rows
+                # stay unconstrained.
+                cur.execute("""
+                    create unique index if not exists user_profiles_email_uniq
+                    on user_profiles(email) where email is not null;
+                """)
+        _tables_ready = True
+
 # Pydantic models
 class ExperienceItem(BaseModel):
     title: str
@@ -114,7 +198,166 @@ class ResumeSchema(BaseModel):
     projects: List[ProjectItem]
     skills: SkillsItem
 
+# Hand-written compact schema shape, mirroring ResumeSchema. The model
+# only needs the field names and nesting; the full model_json_schema()
+# output ($defs, anyOf, titles) is hundreds of extra prompt tokens per
+# upload that buy nothing with response_format=json_object.
+_SCHEMA_DESCRIPTION = (
+    "{\n"
+    '  "name": string,\n'
+    '  "email": string,\n'
+    '  "phone": string,\n'
+    '  "links": {"linkedin": string, "github": string, "portfolio": string, "other": [string]},\n'
+    '  "summary": string,\n'
+    '  "education": [{"institution": string, "degree": string, "field": string, "start": string, "end": string, "grade_type": string, "grade_value": string}],\n'
+    '  "experience": [{"title": string, "company": string, "location": string, "start": string, "end": string, "bullets": [string]}],\n'
+    '  "projects": [{"name": string, "description": string, "tech_stack": [string]}],\n'
+    '  "skills": {"programming_languages": [string], "frameworks_libraries": [string], "tools": [string], "other": [string]}\n'
+    "}"
+)
+_PARSE_SYSTEM_PROMPT = (
+    "Extract resume details from the provided text and return ONLY valid JSON matching this exact schema:\n"
+    + _SCHEMA_DESCRIPTION
+    + "\n\nCRITICAL: Return ONLY the JSON object. No markdown, no code blocks, no explanations. "
+    "Populate all fields from the resume text. Use empty strings or empty arrays for missing data.\n\n"
+    "CRITICAL EDUCATION EXTRACTION RULES:\n"
+    "- For 10th/SSLC/SSC: Look ONLY for '10th', 'SSLC', 'SSC', 'Class 10', or 'X'. DO NOT confuse with 12th.\n"
+    "- For 12th/PUC/HSC: Look ONLY for '12th', '2 PU', '2pu', '2 pu', 'PUC', 'HSC', 'Class 12', 'II PUC', 'XII', 'Intermediate', 'Pre-University College', 'Pre-University', or '(PUC)'. "
+    "These are DIFFERENT from 10th - do not mix them up.\n"
+    "- When creating education entries, clearly label each one. If you see '2 PU' or 'PUC', that is 12th, NOT 10th.\n"
+    "- If a percentage appears near '2 PU', 'PUC', or 'HSC', it belongs to 12th, not 10th.\n"
+    "- If a percentage appears near 'SSLC', 'SSC', or '10th', it belongs to 10th, not 12th.\n"
+    "- Be very careful to distinguish between these two - they are completely different education levels."
+)
+
+# Content-addressed cache of Groq completions. Re-uploads of the same
+# PDF and regenerated reports repeat the exact same prompt, so the
+# response can be served without touching the network. Bounded LRU on
+# the stdlib OrderedDict.
+_LLM_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_LLM_CACHE_MAX = 256
+_llm_cache_lock = threading.Lock()
+
+def _llm_cache_key(model: str, system_prompt: str, user_content: str) -> str:
+    return hashlib.sha256(
+        "\0".join((model, system_prompt, user_content)).encode()
+    ).hexdigest()
+
+def _llm_cache_get(key: str) -> Optional[str]:
+    with _llm_cache_lock:
+        content = _LLM_CACHE.get(key)
+        if content is not None:
+            _LLM_CACHE.move_to_end(key)
+        return content
+
+def _llm_cache_put(key: str, content: str) -> None:
+    with _llm_cache_lock:
+        _LLM_CACHE[key] = content
+        _LLM_CACHE.move_to_end(key)
+        while len(_LLM_CACHE) > _LLM_CACHE_MAX:
+            _LLM_CACHE.popitem(last=False)
+
+# One Groq client per process; per-request construction threw away the
+# underlying httpx connection pool (and its keep-alive connections).
+_groq_client = None
+_groq_client_lock = threading.Lock()
+
+def get_groq_client(api_key: str):
+    global _groq_client
+    if _groq_client is not None:
+        return _groq_client
+    with _groq_client_lock:
+        if _groq_client is None:
+            from groq import Groq
+            _groq_client = Groq(api_key=api_key)
+        return _groq_client
+
+# Regexes for _fallback_minimal_parse, compiled once at import. The parser
+# runs on every upload; module-level patterns skip the re-cache lookup and
+# recompilation risk on each call.
+# Quantifiers are bounded (RFC local parts are <=64 chars, labels <=255)
+# so each match attempt does constant work: an unbounded `+` here made the
+# scan quadratic on long alphanumeric runs with no "@".
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,24}")
+_PHONE_RE = re.compile(r"(?:\+\d{1,3}[\s-]?)?\d{10}")
+_TENTH_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"10th[:\s]+(\d{1,2}(?:\.\d+)?%)",
+        r"10[:\s]+(\d{1,2}(?:\.\d+)?%)",
+        r"(?:SSLC|SSC)[:\s]+(\d{1,2}(?:\.\d+)?%)",
+    )
+]
+# The old lazy `.*?` + DOTALL variants could backtrack quadratically on
+# long resumes. The labelled form stays as-is, and a single bounded-gap
+# pattern ([^%]{0,80}? caps how far the engine may look past a keyword)
+# replaces the unbounded ones; percentages further away are handled by
+# the keyword-window scan below.
+_TWELFTH_PATTERNS = [
+    re.compile(
+        r"(?:12th|2\s*PU|2PU|PUC|HSC|II\s*PU|Class\s*12|XII|Intermediate|Pre[- ]?University|Pre[- ]?Univ)[:\s\-]+(\d{1,2}(?:\.\d+)?\s*%)",
+        re.IGNORECASE,
+    ),
+    re.compile(
+        r"(?:12th|2\s*PU|2PU|PUC|HSC|II\s*PU|Class\s*12|XII|Intermediate|Pre[- ]?University|Pre[- ]?Univ)[^%]{0,80}?(\d{1,2}(?:\.\d+)?\s*%)",
+        re.IGNORECASE,
+    ),
+]
+# All 12th marker keywords fused into one alternation: a single linear
+# pass over the text instead of one scan per keyword.
+_TWELFTH_KEYWORD_RE = re.compile(
+    r"12th|\(puc\)|puc|hsc|xii|intermediate|class\s*12|2\s*pu|pre[- ]?univ\w*|pre university",
+    re.IGNORECASE,
+)
+_WINDOW_PCT_RE = re.compile(r"(\d{1,2}(?:\.\d+)?\s*%)")
+# The positional classifier needs 10th markers, 12th markers and
+# percentages, each tagged with its class. One combined alternation with
+# named groups emits all three in a single linear scan of the lowercased
+# text — the multi-pattern single-pass idea of DFA engines like
+# Hyperscan, expressed in stdlib re.
+_CLASSIFY_RE = re.compile(
+    r"(?P<tenth>10th|sslc|ssc|class 10|x )"
+    r"|(?P<twelfth>12th|\(puc\)|puc|hsc|xii|intermediate|class\s*12|2\s*pu|pre[- ]?univ\w*|pre university)"
+    r"|(?P<pct>\d{1,2}(?:\.\d+)?%)"
+)
+
+# Term sets for classifying LLM education entries (matched against
+# lowercased institution/degree/field).
+_TENTH_TERMS = ("10th", "sslc", "ssc", "class 10", "x ")
+_TWELFTH_TERMS = (
+    "12th", "2 pu", "2pu", "puc", "hsc", "ii pu", "class 12", "xii",
+    "intermediate", "pre-university", "pre university", "pre-univ", "(puc)",
+)
+_SCHOOL_TERMS = ("10th", "12th", "sslc", "ssc", "2 pu", "2pu", "puc", "hsc", "class 10", "class 12")
+_SCHOOL_TERMS_BASIC = ("10th", "12th", "sslc", "ssc", "2 pu", "2pu", "puc", "hsc")
+_CGPA_RE = re.compile(r"(\d(?:\.\d+)?\s*/\s*10(?:\.0)?)")
+
+# The regex fallback is pure over its input and gets re-run on the LLM
+# retry path and on duplicate uploads within a session. Memoized through
+# the same bounded OrderedDict LRU shape as the Groq cache, keyed by a
+# 16-byte blake2b digest so the cache never pins whole resume texts.
+_FALLBACK_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_FALLBACK_CACHE_MAX = 256
+_fallback_cache_lock = threading.Lock()
+
 def _fallback_minimal_parse(text: str) -> Dict[str, Any]:
+    """Memoizing wrapper around the regex parser fallback"""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    with _fallback_cache_lock:
+        cached = _FALLBACK_CACHE.get(digest)
+        if cached is not None:
+            _FALLBACK_CACHE.move_to_end(digest)
+            # Fresh copy: callers attach notes and merge into the result.
+            return {**cached, "experience": []}
+    result = _fallback_minimal_parse_uncached(text)
+    with _fallback_cache_lock:
+        _FALLBACK_CACHE[digest] = result
+        _FALLBACK_CACHE.move_to_end(digest)
+        while len(_FALLBACK_CACHE) > _FALLBACK_CACHE_MAX:
+            _FALLBACK_CACHE.popitem(last=False)
+    return {**result, "experience": []}
+
+def _fallback_minimal_parse_uncached(text: str) -> Dict[str, Any]:
     """Lightweight regex-based parser fallback"""
     email = ""
     phone = ""
@@ -124,44 +367,30 @@ def _fallback_minimal_parse(text: str) -> Dict[str, Any]:
     name = ""
     
     try:
-        m_email = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
+        m_email = _EMAIL_RE.search(text)
         if m_email:
             email = m_email.group(0)
     except Exception:
         pass
-    
+
     try:
-        m_phone = re.search(r"(?:\+\d{1,3}[\s-]?)?\d{10}", text)
+        m_phone = _PHONE_RE.search(text)
         if m_phone:
             phone = m_phone.group(0)
     except Exception:
         pass
-    
+
     try:
         # Extract 10th percentage
-        tenth_patterns = [
-            r"10th[:\s]+(\d{1,2}(?:\.\d+)?%)",
-            r"10[:\s]+(\d{1,2}(?:\.\d+)?%)",
-            r"(?:SSLC|SSC)[:\s]+(\d{1,2}(?:\.\d+)?%)",
-        ]
-        for pattern in tenth_patterns:
-            m = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TENTH_PATTERNS:
+            m = pattern.search(text)
             if m:
                 tenth = m.group(1) if m.groups() else m.group(0)
                 break
-        
+
         # Extract 12th percentage - Widen search to include "Class 12", "XII", "Intermediate", "Pre-University College", "(PUC)"
-        twelfth_patterns = [
-            r"(?:12th|2\s*PU|2PU|PUC|HSC|II\s*PU|Class\s*12|XII|Intermediate|Pre[- ]?University|Pre[- ]?Univ)[:\s\-]+(\d{1,2}(?:\.\d+)?\s*%)",
-            r"(?:12th|2\s*PU|2PU|PUC|HSC|II\s*PU|Class\s*12|XII|Intermediate|Pre[- ]?University|Pre[- ]?Univ).*?(\d{1,2}(?:\.\d+)?\s*%)",
-            r"(\d{1,2}(?:\.\d+)?\s*%)(?=.*(?:12th|2\s*PU|2PU|PUC|HSC|II\s*PU|Class\s*12|XII|Intermediate|Pre[- ]?University|Pre[- ]?Univ))",
-            # Look for number without % if explicitly labeled
-            r"(?:12th|2\s*PU|2PU|PUC|HSC|II\s*PU|Class\s*12|XII|Intermediate|Pre[- ]?University|Pre[- ]?Univ).*?(\d+(?:\.\d+)?)\s*%",
-            # Pattern for "(PUC)" or "Pre-University College"
-            r"(?:\(PUC\)|Pre[- ]?University\s+College).*?(\d{1,2}(?:\.\d+)?\s*%)",
-        ]
-        for pattern in twelfth_patterns:
-            m = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _TWELFTH_PATTERNS:
+            m = pattern.search(text)
             if m:
                 twelfth = m.group(1).strip() if m.groups() else m.group(0).strip()
                 if not twelfth.endswith("%"):
@@ -170,62 +399,78 @@ def _fallback_minimal_parse(text: str) -> Dict[str, Any]:
         
         # Context-aware window search for 12th if regex failed
         if not twelfth:
-            # Find keywords and look for percentages in +/- 60 chars
-            keywords = ["12th", "puc", "hsc", "xii", "intermediate", "class 12", "2 pu", "pre-university", "pre university", "pre-univ", "(puc)"]
-            for keyword in keywords:
-                for m in re.finditer(re.escape(keyword), text, re.IGNORECASE):
-                    start = max(0, m.start() - 60)
-                    end = min(len(text), m.end() + 60)
-                    window = text[start:end]
-                    # Find percentage in this window
-                    p_match = re.search(r"(\d{1,2}(?:\.\d+)?\s*%)", window)
-                    if p_match:
-                        val = p_match.group(1).replace(" ", "")
-                        # Avoid if it's 10th/SSLC
-                        if "10th" not in window.lower() and "sslc" not in window.lower() and "ssc" not in window.lower():
-                            twelfth = val
-                            break
-                if twelfth: break
+            # One pass over all keyword hits, looking for percentages in
+            # +/- 60 chars around each
+            for m in _TWELFTH_KEYWORD_RE.finditer(text):
+                start = max(0, m.start() - 60)
+                end = min(len(text), m.end() + 60)
+                window = text[start:end]
+                # Find percentage in this window
+                p_match = _WINDOW_PCT_RE.search(window)
+                if p_match:
+                    val = p_match.group(1).replace(" ", "")
+                    # Avoid if it's 10th/SSLC
+                    if "10th" not in window.lower() and "sslc" not in window.lower() and "ssc" not in window.lower():
+                        twelfth = val
+                        break
 
         # Only use fallback if specific patterns didn't match
         # This prevents confusing 10th and 12th percentages
         if not tenth or not twelfth:
-            # Find all percentages with context
+            # One pass: lowercase once, then a single combined scan tags
+            # every keyword and percentage hit with its class. Each
+            # percentage is classified by a bisect into the keyword offset
+            # lists instead of slicing and rescanning a +/-50 context.
+            text_lower = text.lower()
+            tenth_positions: List[int] = []
+            twelfth_positions: List[int] = []
+            pct_hits: List[tuple] = []
+            for m in _CLASSIFY_RE.finditer(text_lower):
+                if m.lastgroup == "pct":
+                    pct_hits.append((m.group(), m.start(), m.end()))
+                elif m.lastgroup == "tenth":
+                    tenth_positions.append(m.start())
+                else:
+                    twelfth_positions.append(m.start())
+
+            def near(positions: List[int], lo: int, hi: int) -> bool:
+                i = bisect.bisect_left(positions, lo)
+                return i < len(positions) and positions[i] <= hi
+
             all_percents = []
-            for match in re.finditer(r"(\d{1,2}(?:\.\d+)?%)", text):
-                percent = match.group(1)
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].lower()
-                
-                # Classify based on nearby text
-                if any(term in context for term in ["10th", "sslc", "ssc", "class 10", "x "]) and not tenth:
+            for percent, start, end in pct_hits:
+                lo = start - 50
+                hi = end + 50
+
+                # Classify based on nearby keywords
+                if near(tenth_positions, lo, hi) and not tenth:
                     tenth = percent
-                elif any(term in context for term in ["12th", "2 pu", "2pu", "puc", "hsc", "class 12", "xii", "intermediate", "pre-university", "pre university", "(puc)"]) and not twelfth:
+                elif near(twelfth_positions, lo, hi) and not twelfth:
                     twelfth = percent
                 else:
-                    all_percents.append((percent, context))
-            
+                    all_percents.append(percent)
+
             # If still missing, use position-based assignment (10th usually comes before 12th)
             if not tenth and all_percents:
-                tenth = all_percents[0][0]
+                tenth = all_percents[0]
             if not twelfth and len(all_percents) > 1:
-                twelfth = all_percents[1][0]
+                twelfth = all_percents[1]
             elif not twelfth and len(all_percents) == 1 and not tenth:
                 # Only one percentage found, assume it's 10th
-                tenth = all_percents[0][0]
+                tenth = all_percents[0]
     except Exception:
         pass
     
     try:
-        cgpa = re.search(r"(\d(?:\.\d+)?\s*/\s*10(?:\.0)?)", text)
+        cgpa = _CGPA_RE.search(text)
         if cgpa:
             degree = cgpa.group(1).replace(" ", "")
     except Exception:
         pass
     
-    # Name extraction
-    for line in text.splitlines():
+    # Name extraction: the name sits in the first few lines, so cap the
+    # split at 20 lines instead of materializing every line of the PDF.
+    for line in text.split("\n", 20)[:20]:
         ln = line.strip()
         if len(ln.split()) >= 2 and len(ln) <= 80:
             name = ln
@@ -254,8 +499,7 @@ def health():
     try:
         db_url = get_db_url()
         if db_url:
-            import psycopg
-            with psycopg.connect(db_url, autocommit=True) as conn:
+            with _get_db_pool(db_url).connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT 1")
             db_ok = True
@@ -283,99 +527,111 @@ async def upload_resume(file: UploadFile = File(...), cleanup: bool = False, mod
     
     tmp_path = None
     try:
+        # Stream the upload to disk in chunks; file.read() would buffer
+        # the whole PDF in RAM first. The sync copy runs in the
+        # threadpool so concurrent uploads keep the event loop free.
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(await file.read())
             tmp_path = tmp.name
+            await run_in_threadpool(shutil.copyfileobj, file.file, tmp, 1 << 20)
 
-        text = read_pdf_text(tmp_path)
+        # PDF extraction is CPU-bound; run it off the event loop.
+        text = await run_in_threadpool(read_pdf_text, tmp_path)
         if not text:
             raise HTTPException(status_code=400, detail="No text could be extracted from PDF")
 
-        fallback_payload = _fallback_minimal_parse(text)
+        # Kick off the regex fallback in the threadpool; it overlaps the
+        # Groq round-trip below and is awaited only on paths that need it.
+        fallback_task = asyncio.ensure_future(
+            run_in_threadpool(_fallback_minimal_parse, text)
+        )
 
         key = get_groq_key()
         if not key:
+            fallback_payload = await fallback_task
             fallback_payload["note"] = "GROQ_API_KEY not configured; returned minimal parse."
             return fallback_payload
 
         # LLM cleanup if requested
         if cleanup and clean_with_groq_llm:
             try:
-                text = clean_with_groq_llm(text, model=model, api_key=key, verbose=False)
+                text = await run_in_threadpool(
+                    clean_with_groq_llm, text, model=model, api_key=key, verbose=False
+                )
             except Exception as e:
                 print(f"Warning: LLM cleanup failed: {e}", file=sys.stderr)
 
         # Use Groq for structured parsing
         try:
-            from groq import Groq
-            client = Groq(api_key=key)
-            
-            schema = ResumeSchema.model_json_schema()
-            system_prompt = (
-                "Extract resume details from the provided text and return ONLY valid JSON matching this exact schema:\n"
-                + json.dumps(schema, indent=2, ensure_ascii=False)
-                + "\n\nCRITICAL: Return ONLY the JSON object. No markdown, no code blocks, no explanations. "
-                "Populate all fields from the resume text. Use empty strings or empty arrays for missing data.\n\n"
-                "CRITICAL EDUCATION EXTRACTION RULES:\n"
-                "- For 10th/SSLC/SSC: Look ONLY for '10th', 'SSLC', 'SSC', 'Class 10', or 'X'. DO NOT confuse with 12th.\n"
-                "- For 12th/PUC/HSC: Look ONLY for '12th', '2 PU', '2pu', '2 pu', 'PUC', 'HSC', 'Class 12', 'II PUC', 'XII', 'Intermediate', 'Pre-University College', 'Pre-University', or '(PUC)'. "
-                "These are DIFFERENT from 10th - do not mix them up.\n"
-                "- When creating education entries, clearly label each one. If you see '2 PU' or 'PUC', that is 12th, NOT 10th.\n"
-                "- If a percentage appears near '2 PU', 'PUC', or 'HSC', it belongs to 12th, not 10th.\n"
-                "- If a percentage appears near 'SSLC', 'SSC', or '10th', it belongs to 10th, not 12th.\n"
-                "- Be very careful to distinguish between these two - they are completely different education levels."
-            )
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": text},
-            ]
-            
-            resp = client.chat.completions.create(
-                model=model,
-                messages=messages,
-                response_format={"type": "json_object"},
-                temperature=0.0,
-            )
-            
-            clean_json = resp.choices[0].message.content or "{}"
-            parsed = json.loads(clean_json)
+            client = get_groq_client(key)
+
+            cache_key = _llm_cache_key(model, _PARSE_SYSTEM_PROMPT, text)
+            clean_json = _llm_cache_get(cache_key)
+            if clean_json is None:
+                messages = [
+                    {"role": "system", "content": _PARSE_SYSTEM_PROMPT},
+                    {"role": "user", "content": text},
+                ]
+
+                resp = await run_in_threadpool(
+                    client.chat.completions.create,
+                    model=model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.0,
+                )
+
+                clean_json = resp.choices[0].message.content or "{}"
+                _llm_cache_put(cache_key, clean_json)
+            parsed = orjson.loads(clean_json)
             
             # Extract education data for percentages - be more specific to avoid confusion
             education_list = parsed.get("education", [])
             tenth_pct = ""
             twelfth_pct = ""
             degree_cgpa = ""
-            
-            # First pass: Look for explicit 10th/SSLC/SSC labels
-            # Process in order: 10th first, then 12th, to avoid confusion
+
+            # Single traversal: lowercase each entry once and precompute
+            # classification flags; the 10th/12th picks and both degree
+            # scans below reuse these records instead of re-lowering and
+            # re-scanning the same strings.
+            records = []
             for edu in education_list:
                 institution_lower = (edu.get("institution", "") or "").lower()
                 degree_lower = (edu.get("degree", "") or "").lower()
                 field_lower = (edu.get("field", "") or "").lower()
                 grade_value = edu.get("grade_value", "") or ""
-                
-                # Check for 10th - must be explicit, avoid matching "12th" or "2 pu"
-                # Only assign if we haven't found it yet and it's clearly 10th
-                if not tenth_pct and (any(term in institution_lower or term in degree_lower or term in field_lower 
-                       for term in ["10th", "sslc", "ssc", "class 10", "x "]) and 
-                    "12th" not in institution_lower and "12th" not in degree_lower and 
-                    "2 pu" not in institution_lower and "2pu" not in institution_lower and
-                    "puc" not in institution_lower and "hsc" not in institution_lower):
+                fields = (institution_lower, degree_lower, field_lower)
+
+                # Clearly 10th: explicit marker, and nothing suggesting 12th
+                is_tenth = (
+                    any(term in f for term in _TENTH_TERMS for f in fields)
+                    and "12th" not in institution_lower and "12th" not in degree_lower
+                    and "2 pu" not in institution_lower and "2pu" not in institution_lower
+                    and "puc" not in institution_lower and "hsc" not in institution_lower
+                )
+                # Clearly 12th: explicit marker, and nothing suggesting 10th
+                is_twelfth = (
+                    any(term in f for term in _TWELFTH_TERMS for f in fields)
+                    and "10th" not in institution_lower and "10th" not in degree_lower
+                    and "sslc" not in institution_lower and "ssc" not in institution_lower
+                )
+                is_school = any(term in f for term in _SCHOOL_TERMS for f in fields)
+                is_school_basic = any(term in f for term in _SCHOOL_TERMS_BASIC for f in fields)
+                records.append((grade_value, is_tenth, is_twelfth, is_school, is_school_basic))
+
+            # Process in order: 10th first, then 12th, to avoid confusion
+            for grade_value, is_tenth, is_twelfth, _, _ in records:
+                if not tenth_pct and is_tenth:
                     tenth_pct = grade_value
-                
-                # Check for 12th - must be explicit, avoid matching "10th"
-                # Only assign if we haven't found it yet and it's clearly 12th
-                if not twelfth_pct and (any(term in institution_lower or term in degree_lower or term in field_lower 
-                       for term in ["12th", "2 pu", "2pu", "puc", "hsc", "ii pu", "class 12", "xii", "intermediate", 
-                                   "pre-university", "pre university", "pre-univ", "(puc)"]) and
-                    "10th" not in institution_lower and "10th" not in degree_lower and
-                    "sslc" not in institution_lower and "ssc" not in institution_lower):
+                if not twelfth_pct and is_twelfth:
                     twelfth_pct = grade_value
             
             # Fallback to regex if not found - use improved extraction
             if not tenth_pct or not twelfth_pct:
-                fallback = _fallback_minimal_parse(text)
+                # Re-run on the (possibly LLM-cleaned) text; without
+                # cleanup this is the already-finished fallback_task
+                # result straight from the parse cache.
+                fallback = await run_in_threadpool(_fallback_minimal_parse, text)
                 # Only use fallback if LLM didn't find it
                 if not tenth_pct:
                     tenth_pct = fallback.get("tenth_percentage", "")
@@ -384,17 +640,9 @@ async def upload_resume(file: UploadFile = File(...), cleanup: bool = False, mod
             
             # Get degree CGPA - look for highest education (usually last or degree-level)
             # Skip entries that are clearly 10th/12th
-            for edu in reversed(education_list):  # Check from end (usually degree is last)
-                institution_lower = (edu.get("institution", "") or "").lower()
-                degree_lower = (edu.get("degree", "") or "").lower()
-                field_lower = (edu.get("field", "") or "").lower()
-                grade_value = edu.get("grade_value", "") or ""
-                
-                # Skip if it's clearly 10th or 12th
-                if any(term in institution_lower or term in degree_lower or term in field_lower 
-                       for term in ["10th", "12th", "sslc", "ssc", "2 pu", "2pu", "puc", "hsc", "class 10", "class 12"]):
+            for grade_value, _, _, is_school, _ in reversed(records):  # Check from end (usually degree is last)
+                if is_school:
                     continue
-                
                 # Check if grade_value looks like CGPA (has "/" or is a decimal between 0-10)
                 if grade_value:
                     # If it contains "/" it's likely CGPA format
@@ -409,20 +657,13 @@ async def upload_resume(file: UploadFile = File(...), cleanup: bool = False, mod
                             break
                     except:
                         pass
-            
+
             # If still no degree, use first education entry that's not 10th/12th
-            if not degree_cgpa and education_list:
-                for edu in education_list:
-                    institution_lower = (edu.get("institution", "") or "").lower()
-                    degree_lower = (edu.get("degree", "") or "").lower()
-                    field_lower = (edu.get("field", "") or "").lower()
-                    grade_value = edu.get("grade_value", "") or ""
-                    
-                    if not any(term in institution_lower or term in degree_lower or term in field_lower 
-                               for term in ["10th", "12th", "sslc", "ssc", "2 pu", "2pu", "puc", "hsc"]):
-                        if grade_value:
-                            degree_cgpa = grade_value
-                            break
+            if not degree_cgpa:
+                for grade_value, _, _, _, is_school_basic in records:
+                    if not is_school_basic and grade_value:
+                        degree_cgpa = grade_value
+                        break
             
             # Use "--" for missing data
             return {
@@ -439,11 +680,12 @@ async def upload_resume(file: UploadFile = File(...), cleanup: bool = False, mod
                 "degree_percentage_or_cgpa": degree_cgpa or "--",
             }
         except ImportError:
+            fallback_payload = await fallback_task
             fallback_payload["note"] = "groq package not installed; returned minimal parse."
             return fallback_payload
         except Exception as e:
             print(f"Groq parsing failed: {e}", file=sys.stderr)
-            return fallback_payload
+            return await fallback_task
     except HTTPException:
         raise
     except Exception as e:
@@ -491,6 +733,15 @@ async def evaluate(payload: dict):
         "coding": totals.get("coding", 0),
     }
 
+# The format_instructions block never changes; serialize it once at
+# import. The fragment slots in between the sorted academic_profile and
+# test_results keys, so the spliced payload is byte-identical to sorting
+# and dumping the whole dict (which keeps existing cache keys valid).
+_REPORT_FMT_FRAGMENT = orjson.dumps(
+    {"format_instructions": {"headings": True, "no_code": True, "language": "English"}},
+    option=orjson.OPT_SORT_KEYS,
+).decode()[1:-1]
+
 @app.post("/generate-report")
 async def generate_report(payload: dict):
     """
@@ -501,9 +752,8 @@ async def generate_report(payload: dict):
         return {"report_markdown": "# Report Generation Unavailable\n\nGROQ_API_KEY not configured."}
     
     try:
-        from groq import Groq
-        client = Groq(api_key=key)
-        
+        client = get_groq_client(key)
+
         answers = payload.get("answers", [])
         totals = payload.get("totals", {})
         behavior = payload.get("behavior", {})
@@ -519,33 +769,42 @@ async def generate_report(payload: dict):
             "- Keep recommendations realistic for current level. Do not include code fences.\n"
         )
         
-        user_content = {
-            "test_results": {
-                "answers": answers,
-                "totals": totals,
-                "behavior": behavior,
-            },
-            "academic_profile": profile or {},
-            "format_instructions": {
-                "headings": True,
-                "no_code": True,
-                "language": "English",
-            },
-        }
-        
+        user_json = (
+            '{"academic_profile":'
+            + orjson.dumps(profile or {}, option=orjson.OPT_SORT_KEYS).decode()
+            + ","
+            + _REPORT_FMT_FRAGMENT
+            + ',"test_results":'
+            + orjson.dumps(
+                {"answers": answers, "totals": totals, "behavior": behavior},
+                option=orjson.OPT_SORT_KEYS,
+            ).decode()
+            + "}"
+        )
+        cache_key = _llm_cache_key(model, system_prompt, user_json)
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            return {"report_markdown": cached}
+
         messages = [
             {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(user_content, ensure_ascii=False)},
+            {"role": "user", "content": user_json},
         ]
-        
-        resp = client.chat.completions.create(
+
+        # The frontend consumes this as JSON ({"report_markdown": ...}),
+        # so the completion is buffered rather than streamed; the Groq
+        # round-trip runs in the threadpool to keep the loop free.
+        resp = await run_in_threadpool(
+            client.chat.completions.create,
             model=model,
             messages=messages,
             temperature=0.2,
         )
-        
-        content = resp.choices[0].message.content or ""
-        return {"report_markdown": content.strip()}
+
+        report = (resp.choices[0].message.content or "").strip()
+        if report:
+            _llm_cache_put(cache_key, report)
+        return {"report_markdown": report}
     except Exception as e:
         return {
             "report_markdown": f"# Report Generation Error\n\n{str(e)}",
@@ -558,12 +817,17 @@ async def generate_report_underscore(payload: dict):
     return await generate_report(payload)
 
 @app.post("/users")
-def create_or_get_user(payload: dict):
+async def create_or_get_user(payload: dict):
     """
     Create or get user profile.
     Body: { name, email, phone, tenth_percentage, twelfth_percentage, degree_percentage_or_cgpa, experience }
     Returns: { user_id, persisted }
     """
+    # Blocking psycopg work runs in the threadpool so the event loop
+    # keeps serving requests during Postgres round-trips.
+    return await run_in_threadpool(_create_or_get_user_sync, payload)
+
+def _create_or_get_user_sync(payload: dict):
     name = (payload.get("name") or "").strip()
     email = (payload.get("email") or "").strip()
     phone = (payload.get("phone") or "").strip()
@@ -582,55 +846,37 @@ def create_or_get_user(payload: dict):
     try:
         import psycopg
         from psycopg.rows import dict_row
-        
-        # Ensure tables exist
-        with psycopg.connect(db_url, autocommit=True) as conn:
-            with conn.cursor() as cur:
-                try:
-                    cur.execute("create extension if not exists pgcrypto;")
-                except Exception:
-                    pass
-                cur.execute("""
-                    create table if not exists user_profiles (
-                      id uuid primary key default gen_random_uuid(),
-                      name text not null,
-                      email text,
-                      phone text,
-                      tenth_percentage text,
-                      twelfth_percentage text,
-                      degree_percentage_or_cgpa text,
-                      experience jsonb,
-                      aptitude_level text,
-                      reasoning_level text,
-                      coding_level text,
-                      created_at timestamptz not null default now()
-                    );
-                """)
-        
-        with psycopg.connect(db_url, autocommit=True) as conn:
+
+        ensure_tables()
+        with _get_db_pool(db_url).connection() as conn:
             with conn.cursor(row_factory=dict_row) as cur:
+                # Jsonb ships experience in binary, skipping text JSON on
+                # the wire.
+                params = (name, email or None, phone or None, tenth, twelfth, degree, psycopg.types.json.Jsonb(exp))
                 if email:
-                    cur.execute("select id from user_profiles where email=%s limit 1", (email,))
-                    row = cur.fetchone()
-                    if row:
-                        cur.execute(
-                            """
-                            update user_profiles
-                            set name=%s, phone=%s, tenth_percentage=%s, twelfth_percentage=%s,
-                                degree_percentage_or_cgpa=%s, experience=%s
-                            where id=%s
-                            """,
-                            (name, phone or None, tenth, twelfth, degree, psycopg.types.json.Json(exp), row["id"]),
-                        )
-                        return {"user_id": str(row["id"]), "persisted": True}
-                
-                cur.execute(
-                    """
-                    insert into user_profiles(name,email,phone,tenth_percentage,twelfth_percentage,degree_percentage_or_cgpa,experience)
-                    values(%s,%s,%s,%s,%s,%s,%s) returning id
-                    """,
-                    (name, email or None, phone or None, tenth, twelfth, degree, psycopg.types.json.Json(exp)),
-                )
+                    # Single round-trip for new and returning users alike.
+                    cur.execute(
+                        """
+                        insert into user_profiles(name,email,phone,tenth_percentage,twelfth_percentage,degree_percentage_or_cgpa,experience)
+                        values(%s,%s,%s,%s,%s,%s,%s)
+                        on conflict (email) where email is not null do update
+                        set name=excluded.name, phone=excluded.phone,
+                            tenth_percentage=excluded.tenth_percentage,
+                            twelfth_percentage=excluded.twelfth_percentage,
+                            degree_percentage_or_cgpa=excluded.degree_percentage_or_cgpa,
+                            experience=excluded.experience
+                        returning id
+                        """,
+                        params,
+                    )
+                else:
+                    cur.execute(
+                        """
+                        insert into user_profiles(name,email,phone,tenth_percentage,twelfth_percentage,degree_percentage_or_cgpa,experience)
+                        values(%s,%s,%s,%s,%s,%s,%s) returning id
+                        """,
+                        params,
+                    )
                 user_id = cur.fetchone()["id"]
                 return {"user_id": str(user_id), "persisted": True}
     except Exception as e:
@@ -656,6 +902,18 @@ def parse_cgpa(s: str) -> Optional[float]:
     except Exception:
         return None
 
+# Scoring bands as threshold/points tables: bisect_right finds the band
+# in C instead of walking an if/elif ladder per component.
+_CGPA_TH = (7.0, 8.0, 9.0)
+_CGPA_PTS = (1, 2, 3, 4)
+_TWELFTH_TH = (80, 90, 95)
+_TWELFTH_PTS = (1, 2, 3, 4)
+_TENTH_TH = (85, 95)
+_TENTH_PTS = (1, 2, 3)
+_EXP_PTS = (1, 2, 3, 4)
+_STRENGTH_TH = (6, 9, 12)
+_STRENGTH_LBL = ("WEAK", "AVERAGE", "STRONG", "EXTREMELY_STRONG")
+
 def compute_resume_strength(row: Dict[str, Any]) -> str:
     """Compute resume strength based on academic scores and experience"""
     cgpa = parse_cgpa(row.get("degree_percentage_or_cgpa") or "")
@@ -663,34 +921,15 @@ def compute_resume_strength(row: Dict[str, Any]) -> str:
     tenth = parse_percent(row.get("tenth_percentage") or "")
     exp_list = row.get("experience") or []
     exp_len = len(exp_list) if isinstance(exp_list, list) else 0
-    score = 0
-    
+
+    score = _EXP_PTS[min(exp_len, 3)]
     if cgpa is not None:
-        if cgpa >= 9.0: score += 4
-        elif cgpa >= 8.0: score += 3
-        elif cgpa >= 7.0: score += 2
-        else: score += 1
+        score += _CGPA_PTS[bisect.bisect_right(_CGPA_TH, cgpa)]
     if twelfth is not None:
-        if twelfth >= 95: score += 4
-        elif twelfth >= 90: score += 3
-        elif twelfth >= 80: score += 2
-        else: score += 1
+        score += _TWELFTH_PTS[bisect.bisect_right(_TWELFTH_TH, twelfth)]
     if tenth is not None:
-        if tenth >= 95: score += 3
-        elif tenth >= 85: score += 2
-        else: score += 1
-    if exp_len >= 3: score += 4
-    elif exp_len == 2: score += 3
-    elif exp_len == 1: score += 2
-    else: score += 1
-
-    if score >= 12:
-        return "EXTREMELY_STRONG"
-    if score >= 9:
-        return "STRONG"
-    if score >= 6:
-        return "AVERAGE"
-    return "WEAK"
+        score += _TENTH_PTS[bisect.bisect_right(_TENTH_TH, tenth)]
+    return _STRENGTH_LBL[bisect.bisect_right(_STRENGTH_TH, score)]
 
 def final_level_by_matrix(resume_strength: str, user_level: str) -> str:
     """Determine final question level based on resume strength and user's self-assessed level"""
@@ -713,8 +952,79 @@ def final_level_by_matrix(resume_strength: str, user_level: str) -> str:
         if u == "advance": return "advance"
     return u
 
-def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
-    """Load questions from zip file or txt files"""
+# parse_txt patterns, compiled once at import. The parser hits these on
+# every question block of every bank; inline re.search went through the
+# re module cache (and recompiled on eviction) thousands of times per
+# load. Same constants as backend/api.py.
+_RE_ANS = re.compile(r"Answer:\s*([A-Da-d])")
+_RE_NUM_PREFIX = re.compile(r"^(Q?\d+\.\s*)")
+# Inline options sit on one line, so the lazy groups are negated
+# character classes that cannot cross a newline; the old `.*?` + re.S
+# trio backtracked across the whole block when a later letter was
+# missing. Multi-line option layouts fall through to the per-line scan.
+_RE_OPTS_INLINE = re.compile(r"A\)[ \t]*([^\n]*?)\s+B\)[ \t]*([^\n]*?)\s+C\)[ \t]*([^\n]*?)\s+D\)[ \t]*(.*)", re.S)
+# All four option letters in one alternation: one multiline scan of the
+# block instead of a separate search per letter.
+_RE_OPT_ANY = re.compile(r"^([A-D])[\).\]]\s*(.*)$", re.M)
+_RE_BLOCK_SPLIT = re.compile(r"(?=^(?:Q?\d+\.))", re.M)
+_RE_BLOCK_HEAD = re.compile(r"^(?:Q?\d+\.\s*)?(.*)", re.M)
+_RE_ANS_UPPER = re.compile(r"Answer:\s*([A-D])", re.M)
+# Level headers: one case-insensitive scan per line instead of a
+# lowercase copy plus three substring tests.
+_RE_LEVEL = re.compile(r"beginner|intermediate|advanced", re.I)
+# Answer letter -> option index; the inline dict literal reallocated on
+# every flushed question.
+_ANS_IDX = {"A": 0, "B": 1, "C": 2, "D": 3}
+
+# Zip entry name -> domain bucket, ordered by priority; the first needle
+# found wins, replacing the if/elif substring ladder per file. Same table
+# as backend/api.py.
+_ZIP_DOMAIN = (
+    ("aptitude", "aptitude"),
+    ("reason", "reasoning"),
+    ("coding", "coding"),
+    ("general", "coding"),
+    ("dsa", "coding"),
+    ("oops", "coding"),
+    ("os", "coding"),
+)
+
+# Process-static bank locations; parent_dir is already the project root
+# resolved at import.
+_TXT_BANKS_DIR = os.path.join(parent_dir, "questions_bundle")
+_BUNDLE_PATH = os.path.join(parent_dir, "questions_bundle.zip")
+
+_LEVELS = ("beginner", "intermediate", "advance")
+
+def _bucket_by_level(qs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    buckets: Dict[str, List[Dict[str, Any]]] = {lvl: [] for lvl in _LEVELS}
+    for q in qs:
+        lvl = str(q.get("level", "")).lower()
+        if lvl in buckets:
+            buckets[lvl].append(q)
+    return buckets
+
+def load_questions_bundle(bundle_path: str) -> Dict[str, Dict[str, Any]]:
+    """Load questions from zip file or txt files.
+
+    The banks are immutable between deploys, so the parsed dict is cached
+    per (path, mtime): repeat quiz starts skip the zip reads and txt
+    parsing entirely, and an updated bundle invalidates via its mtime.
+    Each domain carries its level buckets, partitioned once at load time
+    so pick_by_level never refilters the full bank per request.
+    """
+    try:
+        mtime = os.path.getmtime(bundle_path)
+    except OSError:
+        mtime = 0.0
+    return _load_bundle_cached(bundle_path, mtime)
+
+@lru_cache(maxsize=8)
+def _load_bundle_cached(bundle_path: str, mtime: float) -> Dict[str, Dict[str, Any]]:
+    banks = _parse_banks(bundle_path)
+    return {cat: {"all": qs, "levels": _bucket_by_level(qs)} for cat, qs in banks.items()}
+
+def _parse_banks(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
     result: Dict[str, List[Dict[str, Any]]] = {"aptitude": [], "reasoning": [], "coding": []}
     
     # Try zip file first
@@ -727,13 +1037,11 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
                         continue
                     with zf.open(name) as f:
                         try:
-                            data = json.loads(f.read().decode("utf-8"))
-                            if "aptitude" in lower:
-                                result["aptitude"].extend(data)
-                            elif "reason" in lower:
-                                result["reasoning"].extend(data)
-                            elif "coding" in lower or "general" in lower or "dsa" in lower or "oops" in lower or "os" in lower:
-                                result["coding"].extend(data)
+                            data = orjson.loads(f.read())
+                            for needle, domain in _ZIP_DOMAIN:
+                                if needle in lower:
+                                    result[domain].extend(data)
+                                    break
                         except Exception:
                             continue
             if any(result.values()):
@@ -752,17 +1060,22 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
         cur: List[str] = []
         cur_level = "beginner"
         
-        def flush(seg: List[str], level: str):
+        def flush(seg: List[str], level: str, ans_key: Optional[str] = None):
             txt = "\n".join(seg).strip()
             if not txt:
                 return
-            m_ans = re.search(r"Answer:\s*([A-Da-d])", txt)
-            if not m_ans:
-                return
-            ans_key = m_ans.group(1).upper()
-            head = re.split(r"Answer:\s*[A-Da-d]", txt)[0].strip()
-            head = re.sub(r"^(Q?\d+\.\s*)", "", head)
-            m_opts = re.search(r"A\)\s*(.*?)\s+B\)\s*(.*?)\s+C\)\s*(.*?)\s+D\)\s*(.*)", head, flags=re.S)
+            if ans_key is not None:
+                # The caller already found the answer on the last line;
+                # skip rescanning the whole accumulated block for it.
+                head = "\n".join(seg[:-1]).strip()
+            else:
+                m_ans = _RE_ANS.search(txt)
+                if not m_ans:
+                    return
+                ans_key = m_ans.group(1).upper()
+                head = txt[:m_ans.start()].strip()
+            head = _RE_NUM_PREFIX.sub("", head)
+            m_opts = _RE_OPTS_INLINE.search(head)
             question = head
             options: List[str] = []
             if m_opts:
@@ -771,13 +1084,13 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
             else:
                 question_line, *rest = head.splitlines()
                 question = question_line.strip().rstrip(":").strip()
-                for opt_key in ["A", "B", "C", "D"]:
-                    mm = re.search(rf"^{opt_key}[\).\]]\s*(.*)$", head, flags=re.M)
-                    if mm:
-                        options.append(mm.group(1).strip())
+                slots: Dict[str, str] = {}
+                for mm in _RE_OPT_ANY.finditer(head):
+                    slots.setdefault(mm.group(1), mm.group(2).strip())
+                options = [slots[k] for k in "ABCD" if k in slots]
             correct = ""
             if options:
-                idx = {"A":0,"B":1,"C":2,"D":3}.get(ans_key, None)
+                idx = _ANS_IDX.get(ans_key)
                 if idx is not None and 0 <= idx < len(options):
                     correct = options[idx]
             out.append({
@@ -791,44 +1104,40 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
         for ln in lines:
             if not ln.strip():
                 continue
-            low = ln.lower()
-            if "beginner" in low:
-                cur_level = "beginner"
-                continue
-            if "intermediate" in low:
-                cur_level = "intermediate"
-                continue
-            if "advanced" in low:
-                cur_level = "advance"
+            m_level = _RE_LEVEL.search(ln)
+            if m_level:
+                lvl = m_level.group(0).lower()
+                cur_level = "advance" if lvl == "advanced" else lvl
                 continue
             cur.append(ln)
-            if ln.strip().startswith("Answer:"):
-                flush(cur, cur_level)
+            stripped = ln.strip()
+            if stripped.startswith("Answer:"):
+                letter = stripped[7:].strip()[:1].upper()
+                flush(cur, cur_level, letter if letter in ("A", "B", "C", "D") else None)
                 cur = []
         if cur:
             flush(cur, cur_level)
         
         # Fallback parser if nothing found
         if not out:
-            blocks = re.split(r"(?=^(?:Q?\d+\.))", content, flags=re.M)
+            blocks = _RE_BLOCK_SPLIT.split(content)
             for blk in blocks:
                 blk = blk.strip()
                 if not blk:
                     continue
-                m_q = re.match(r"^(?:Q?\d+\.\s*)?(.*)", blk, flags=re.M)
+                m_q = _RE_BLOCK_HEAD.match(blk)
                 if not m_q:
                     continue
                 question = m_q.group(1).strip()
-                opts = []
-                for opt_key in ["A", "B", "C", "D"]:
-                    m_opt = re.search(rf"^{opt_key}[\).\]]\s*(.*)$", blk, flags=re.M)
-                    if m_opt:
-                        opts.append(m_opt.group(1).strip())
-                m_ca = re.search(r"Answer:\s*([A-D])", blk, flags=re.M)
+                slots: Dict[str, str] = {}
+                for m_opt in _RE_OPT_ANY.finditer(blk):
+                    slots.setdefault(m_opt.group(1), m_opt.group(2).strip())
+                opts = [slots[k] for k in "ABCD" if k in slots]
+                m_ca = _RE_ANS_UPPER.search(blk)
                 correct = ""
                 if m_ca:
                     key = m_ca.group(1).upper()
-                    idx = {"A":0,"B":1,"C":2,"D":3}.get(key, None)
+                    idx = _ANS_IDX.get(key)
                     if idx is not None and idx < len(opts):
                         correct = opts[idx]
                 out.append({
@@ -842,28 +1151,27 @@ def load_questions_bundle(bundle_path: str) -> Dict[str, List[Dict[str, Any]]]:
         return out
     
     # Load from project root or questions_bundle directory
-    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "questions_bundle"))
-    
-    result["aptitude"] = parse_txt(os.path.join(root, "aptitude.txt")) or parse_txt(os.path.join(base_dir, "aptitude.txt"))
-    result["reasoning"] = parse_txt(os.path.join(root, "reasoning.txt")) or parse_txt(os.path.join(base_dir, "reasoning.txt"))
-    result["coding"] = parse_txt(os.path.join(root, "coding.txt")) or parse_txt(os.path.join(base_dir, "coding.txt")) or parse_txt(os.path.join(base_dir, "general.txt"))
+    result["aptitude"] = parse_txt(os.path.join(parent_dir, "aptitude.txt")) or parse_txt(os.path.join(_TXT_BANKS_DIR, "aptitude.txt"))
+    result["reasoning"] = parse_txt(os.path.join(parent_dir, "reasoning.txt")) or parse_txt(os.path.join(_TXT_BANKS_DIR, "reasoning.txt"))
+    result["coding"] = parse_txt(os.path.join(parent_dir, "coding.txt")) or parse_txt(os.path.join(_TXT_BANKS_DIR, "coding.txt")) or parse_txt(os.path.join(_TXT_BANKS_DIR, "general.txt"))
     
     if not any(result.values()):
         raise RuntimeError("No questions found in zip or txt banks")
     return result
 
-def pick_by_level(items: List[Dict[str, Any]], level: str, count: int) -> List[Dict[str, Any]]:
+def pick_by_level(bank: Dict[str, Any], level: str, count: int) -> List[Dict[str, Any]]:
     """Pick questions of a specific level"""
-    pool = [q for q in items if str(q.get("level", "")).lower() == level.lower()]
+    pool = bank["levels"].get(level.lower(), [])
     if len(pool) < count:
         chosen = pool[:]
-        remaining = [q for q in items if q not in chosen]
-        random.shuffle(remaining)
-        chosen.extend(remaining[: max(0, count - len(chosen))])
+        # Identity set: `q not in chosen` compared whole dicts, making the
+        # fill-up quadratic over the bank.
+        chosen_ids = {id(q) for q in chosen}
+        remaining = [q for q in bank["all"] if id(q) not in chosen_ids]
+        chosen.extend(random.sample(remaining, min(len(remaining), count - len(chosen))))
         return chosen[:count]
-    random.shuffle(pool)
-    return pool[:count]
+    # sample() draws count items without shuffling the whole pool.
+    return random.sample(pool, count)
 
 @app.post("/select_questions")
 def select_questions(payload: dict):
@@ -889,11 +1197,19 @@ def select_questions(payload: dict):
     
     if user_id and db_url:
         try:
-            import psycopg
             from psycopg.rows import dict_row
-            with psycopg.connect(db_url, autocommit=True) as conn:
+            with _get_db_pool(db_url).connection() as conn:
                 with conn.cursor(row_factory=dict_row) as cur:
-                    cur.execute("select * from user_profiles where id=%s limit 1", (user_id,))
+                    # Only the columns compute_resume_strength reads;
+                    # select * dragged every column of the profile row
+                    # across the wire just to score four of them.
+                    cur.execute(
+                        "select tenth_percentage, twelfth_percentage,"
+                        " degree_percentage_or_cgpa, experience"
+                        " from user_profiles where id=%s limit 1",
+                        (user_id,),
+                        prepare=True,
+                    )
                     row = cur.fetchone()
                     if row:
                         resume_row = row
@@ -941,10 +1257,8 @@ def select_questions(payload: dict):
     }
 
     # Load questions
-    bundle_path = os.path.join(os.path.dirname(__file__), "..", "questions_bundle.zip")
-    bundle_path = os.path.abspath(bundle_path)
     try:
-        bank = load_questions_bundle(bundle_path)
+        bank = load_questions_bundle(_BUNDLE_PATH)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load questions: {str(e)}")
 
@@ -982,8 +1296,7 @@ def save_responses(payload: dict):
         return {"saved": False}
     
     try:
-        import psycopg
-        with psycopg.connect(db_url, autocommit=True) as conn:
+        with _get_db_pool(db_url).connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
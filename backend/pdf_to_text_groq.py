@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import argparse
+import bisect
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
 
 try:
@@ -11,38 +15,86 @@ except ImportError:
     raise
 
 
-def read_pdf_text(file_path: str) -> str:
-    reader = PdfReader(file_path)
-    pages_text: List[str] = []
-    for page_index, page in enumerate(reader.pages):
+def _extract_pages(reader: "PdfReader", indices: range) -> List[str]:
+    texts: List[str] = []
+    for page_index in indices:
         try:
-            page_text = page.extract_text() or ""
+            texts.append(reader.pages[page_index].extract_text() or "")
         except Exception as extract_err:
-            page_text = ""
+            texts.append("")
             print(f"Warning: failed to extract text from page {page_index + 1}: {extract_err}", file=sys.stderr)
-        pages_text.append(page_text)
+    return texts
+
+
+def _extract_page_range(file_path: str, indices: range) -> List[str]:
+    # Fresh reader per worker: PdfReader shares one stream internally and
+    # is not safe to drive from several threads at once.
+    return _extract_pages(PdfReader(file_path), indices)
+
+
+def read_pdf_text(file_path: str) -> str:
+    reader = PdfReader(file_path)
+    num_pages = len(reader.pages)
+    # Typical resumes are a page or two; only longer documents are worth
+    # the extra readers and thread dispatch. Reuse the reader already in
+    # hand instead of re-parsing the file.
+    if num_pages <= 2:
+        return "\n".join(_extract_pages(reader, range(num_pages))).strip()
+
+    workers = min(4, num_pages)
+    # Contiguous ranges keep each worker's reads localized and the final
+    # join in page order.
+    bounds = [round(i * num_pages / workers) for i in range(workers + 1)]
+    ranges = [range(bounds[i], bounds[i + 1]) for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        parts = ex.map(_extract_page_range, [file_path] * workers, ranges)
+    pages_text = [t for part in parts for t in part]
     return "\n".join(pages_text).strip()
 
 
 def chunk_text(text: str, max_chars: int) -> List[str]:
     if len(text) <= max_chars:
         return [text]
+    # Newline offsets collected once up front; each split point is then a
+    # bisect instead of an O(max_chars) backwards rfind per chunk.
+    double_breaks = [m.start() for m in re.finditer(r"\n\n", text)]
+    single_breaks = [m.start() for m in re.finditer(r"\n", text)]
     chunks: List[str] = []
     start = 0
     while start < len(text):
         end = min(start + max_chars, len(text))
         # try to break on a paragraph boundary
-        split_at = text.rfind("\n\n", start, end)
-        if split_at == -1:
-            split_at = text.rfind("\n", start, end)
-        if split_at == -1:
-            split_at = end
-        chunks.append(text[start:split_at])
+        split_at = end
+        i = bisect.bisect_right(double_breaks, end - 2)
+        if i and double_breaks[i - 1] >= start:
+            split_at = double_breaks[i - 1]
+        else:
+            j = bisect.bisect_right(single_breaks, end - 1)
+            if j and single_breaks[j - 1] >= start:
+                split_at = single_breaks[j - 1]
+        # strip as we go; a trailing strip-and-filter pass re-walked and
+        # reallocated every chunk
+        piece = text[start:split_at].strip()
+        if piece:
+            chunks.append(piece)
         start = split_at
         # skip any extra newlines at the start of next chunk
         while start < len(text) and text[start] == "\n":
             start += 1
-    return [c for c in (c.strip() for c in chunks) if c]
+    return chunks
+
+
+@lru_cache(maxsize=4)
+def _get_groq_client(api_key: str):
+    # One client per key for the process: the constructor builds a fresh
+    # httpx pool, so per-call construction threw away keep-alive
+    # connections between requests.
+    try:
+        from groq import Groq
+    except ImportError:
+        print("Missing dependency 'groq'. Install with: pip install groq", file=sys.stderr)
+        raise
+    return Groq(api_key=api_key)
 
 
 def clean_with_groq_llm(text: str, model: str, api_key: Optional[str], verbose: bool = False) -> str:
@@ -52,13 +104,7 @@ def clean_with_groq_llm(text: str, model: str, api_key: Optional[str], verbose:
     """
     if not api_key:
         raise RuntimeError("GROQ_API_KEY is not set. Please set the environment variable or pass --groq-api-key.")
-    try:
-        from groq import Groq
-    except ImportError:
-        print("Missing dependency 'groq'. Install with: pip install groq", file=sys.stderr)
-        raise
-
-    client = Groq(api_key=api_key)
+    client = _get_groq_client(api_key)
 
     # Keep chunks conservative to stay within model context limits.
     # Adjust if you use a larger-context model.
@@ -70,18 +116,31 @@ def clean_with_groq_llm(text: str, model: str, api_key: Optional[str], verbose:
         "and spurious whitespace removed. Preserve headings and lists when obvious. Do not summarize."
     )
 
-    for idx, chunk in enumerate(chunks, start=1):
+    def _clean_chunk(numbered_chunk) -> object:
+        idx, chunk = numbered_chunk
         if verbose:
             print(f"[groq] calling model='{model}' for chunk {idx}/{len(chunks)} (chars={len(chunk)})", file=sys.stderr)
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": chunk},
         ]
-        response = client.chat.completions.create(
+        return client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=0.0,
         )
+
+    # The chunks are independent, so multi-chunk documents go out
+    # concurrently instead of paying one round-trip per chunk; ex.map
+    # returns responses in submission order. Single-chunk documents (the
+    # common case for resumes) skip the executor.
+    if len(chunks) == 1:
+        responses = [_clean_chunk((1, chunks[0]))]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as ex:
+            responses = list(ex.map(_clean_chunk, enumerate(chunks, start=1)))
+
+    for response in responses:
         if verbose:
             try:
                 usage = getattr(response, "usage", None)
@@ -114,13 +173,7 @@ def parse_resume_with_groq(
     """
     if not api_key:
         raise RuntimeError("GROQ_API_KEY is not set. Please set the environment variable or pass --groq-api-key.")
-    try:
-        from groq import Groq
-    except ImportError:
-        print("Missing dependency 'groq'. Install with: pip install groq", file=sys.stderr)
-        raise
-
-    client = Groq(api_key=api_key)
+    client = _get_groq_client(api_key)
 
     # Resumes are typically short; still guard with chunking to be safe.
     chunks = chunk_text(text, max_chars=12000)